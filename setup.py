@@ -6,19 +6,16 @@ https://packaging.python.org/en/latest/distributing.html
 https://github.com/pypa/sampleproject
 """
 
-from io import open
-from os import path
-import sys
+import pathlib
 
 # Always prefer setuptools over distutils
 from setuptools import setup
 
-HERE = path.abspath(path.dirname(__file__))
+HERE = pathlib.Path(__file__).parent
 PKG_NAME = 'zendesk_ticket_viewer'
 
 # Get the long description from the README file
-with open(path.join(HERE, 'README.md'), encoding='utf-8') as readme_file:
-    LONG_DESCRIPTION = readme_file.read()
+LONG_DESCRIPTION = (HERE / 'README.md').read_text(encoding='utf-8')
 
 VERSION = "0.1"
 DESCRIPTION = (
@@ -37,7 +34,6 @@ SETUP_KWARGS = dict(
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3.6',
     ],
     keywords='ZenDesk Ticket',
@@ -47,7 +43,6 @@ SETUP_KWARGS = dict(
         'configargparse',
         'requests',
         'urwid',
-        'numpy',
     ],
     setup_requires=[
         "pytest-runner"
@@ -2,31 +2,74 @@
 Tests for CLI module.
 """
 
-from __future__ import generators
-
-import itertools
-import json
-import os
-import pickle
-import unittest
-from copy import copy
-
-import configargparse
 import urwid
-import zenpy
-from six import MovedModule, add_move
 from test_core import TestBase
 from zendesk_ticket_viewer.cli.app import AppFrame, ZTVApp
+from zendesk_ticket_viewer.core import get_client
 from zendesk_ticket_viewer.cli.pages import (BlankPage, ErrorPage, TicketCell,
                                              TicketListPage, TicketViewPage)
 from zendesk_ticket_viewer.cli.widgets import (FormFieldHorizontalPass,
                                                TicketColumn)
-from zendesk_ticket_viewer.core import get_client
 
-if True:
-    # Ensure certain libraries can be imported the same way in PY2/3
-    add_move(MovedModule('mock', 'mock', 'unittest.mock'))
-    from six.moves import mock
+
+def _canvas_text(composite):
+    """Flatten a rendered canvas into a list of text runs in one pass."""
+    return [text for row in composite.content() for _, _, text in row]
+
+
+def _send_keys(page, size, keys):
+    """Send a sequence of keypresses to a page."""
+    for key in keys:
+        page.keypress(size, key)
+
+
+def _expected_with(base, overrides):
+    """Copy the expected content `base` with index -> bytes `overrides`."""
+    expected = list(base)
+    for index, text in overrides.items():
+        expected[index] = text
+    return expected
+
+
+LIST_CONTENT_START = (
+    	b' ', b'Ticket # ', b'Subject             ', b'Type      ', b'Priority  ',
+    	b'>', b'       1 ', b'Sample ticket: Meet ', b'Incident  ', b'normal    ',
+    	b' ', b'       2 ', b'velit eiusmod repreh', b'Ticket    ', b'-         ',
+    	b' ', b'       3 ', b'excepteur laborum ex', b'Ticket    ', b'-         ',
+    	b' ', b'       4 ', b'ad sunt qui aute ull', b'Ticket    ', b'-         ',
+    	b' ', b'       5 ', b'aliquip mollit quis ', b'Ticket    ', b'-         ',
+    	b' ', b'       6 ', b'nisi aliquip ipsum n', b'Ticket    ', b'-         ',
+    	b' ', b'       7 ', b'cillum quis nostrud ', b'Ticket    ', b'-         ',
+    	b' ', b'       8 ', b'proident est nisi no', b'Ticket    ', b'-         ',
+    	b' ', b'       9 ', b'veniam ea eu minim a', b'Ticket    ', b'-         '
+)
+
+LIST_CONTENT_END = (
+    	b' ', b'Ticket # ', b'Subject             ', b'Type      ', b'Priority  ',
+    	b'>', b'     101 ', b'in nostrud occaecat ', b'Ticket    ', b'-         ',
+    	b' ', b'         ', b'                    ', b'          ', b'          ',
+    	b' ', b'         ', b'                    ', b'          ', b'          ',
+    	b' ', b'         ', b'                    ', b'          ', b'          ',
+    	b' ', b'         ', b'                    ', b'          ', b'          ',
+    	b' ', b'         ', b'                    ', b'          ', b'          ',
+    	b' ', b'         ', b'                    ', b'          ', b'          ',
+    	b' ', b'         ', b'                    ', b'          ', b'          ',
+    	b' ', b'         ', b'                    ', b'          ', b'          '
+)
+
+VIEW_CONTENT_INIT = (
+    	b'        Ticket #', b' ', b'                                 ',
+     	b'         Subject', b' ', b'                                 ',
+    	b'        Assignee', b' ', b'                                 ',
+    	b'            Tags', b' ', b'                                 ',
+    	b'            Type', b' ', b'Ticket                           ',
+    	b'        Priority', b' ', b'-                                ',
+    	b'     Description', b' ', b'                                 ',
+    	b'                                                  ',
+    	b'                                                  ',
+    	b'                                                  '
+)
+
 
 class TestCliWidgets(TestBase):
     def test_ticket_cell_render(self):
@@ -55,9 +98,7 @@ class TestCliWidgets(TestBase):
         )
 
         composite = column.render((10, 10), True)
-        text_content = list(
-            text for _, _, text in itertools.chain(*composite.content())
-        )
+        text_content = _canvas_text(composite)
 
         self.assertEqual(
             text_content,
@@ -85,9 +126,7 @@ class TestCliWidgets(TestBase):
             key='password'
         )
         canvas = wg_pass.render((30,))
-        text_content = [
-            text for _, _, text in itertools.chain(*canvas.content())
-        ]
+        text_content = _canvas_text(canvas)
         self.assertEqual(
             text_content,
             [b'Password: ', b' ', b'                   ']
@@ -95,57 +134,20 @@ class TestCliWidgets(TestBase):
 
 
 class TestCliPages(TestBase):
-    # Cache client because it is costly to unpickle every test.
-    _client_cache = None
-
-    list_content_start = [
-    	b' ', b'Ticket # ', b'Subject             ', b'Type      ', b'Priority  ',
-    	b'>', b'       1 ', b'Sample ticket: Meet ', b'Incident  ', b'normal    ',
-    	b' ', b'       2 ', b'velit eiusmod repreh', b'Ticket    ', b'-         ',
-    	b' ', b'       3 ', b'excepteur laborum ex', b'Ticket    ', b'-         ',
-    	b' ', b'       4 ', b'ad sunt qui aute ull', b'Ticket    ', b'-         ',
-    	b' ', b'       5 ', b'aliquip mollit quis ', b'Ticket    ', b'-         ',
-    	b' ', b'       6 ', b'nisi aliquip ipsum n', b'Ticket    ', b'-         ',
-    	b' ', b'       7 ', b'cillum quis nostrud ', b'Ticket    ', b'-         ',
-    	b' ', b'       8 ', b'proident est nisi no', b'Ticket    ', b'-         ',
-    	b' ', b'       9 ', b'veniam ea eu minim a', b'Ticket    ', b'-         '
-    ]
-
-    list_content_end = [
-    	b' ', b'Ticket # ', b'Subject             ', b'Type      ', b'Priority  ',
-    	b'>', b'     101 ', b'in nostrud occaecat ', b'Ticket    ', b'-         ',
-    	b' ', b'         ', b'                    ', b'          ', b'          ',
-    	b' ', b'         ', b'                    ', b'          ', b'          ',
-    	b' ', b'         ', b'                    ', b'          ', b'          ',
-    	b' ', b'         ', b'                    ', b'          ', b'          ',
-    	b' ', b'         ', b'                    ', b'          ', b'          ',
-    	b' ', b'         ', b'                    ', b'          ', b'          ',
-    	b' ', b'         ', b'                    ', b'          ', b'          ',
-    	b' ', b'         ', b'                    ', b'          ', b'          '
-    ]
-
-    view_content_init = [
-    	b'        Ticket #', b' ', b'                                 ',
-     	b'         Subject', b' ', b'                                 ',
-    	b'        Assignee', b' ', b'                                 ',
-    	b'            Tags', b' ', b'                                 ',
-    	b'            Type', b' ', b'Ticket                           ',
-    	b'        Priority', b' ', b'-                                ',
-    	b'     Description', b' ', b'                                 ',
-    	b'                                                  ',
-    	b'                                                  ',
-    	b'                                                  '
-    ]
-
     @classmethod
     def setUpClass(cls):
+        # get_client is memoized, so every test class shares one offline
+        # client and the fixture unpickle cost is paid once per run
         cls.client = get_client(cls.config)
+        # Frame construction is costly; pages hold all mutable scroll
+        # state so a single frame can be shared across render tests.
+        cls.frame = AppFrame(client=cls.client)
 
     def test_blank_page(self):
         """
         Test that a blank app page satisfies the AppPage interface.
         """
-        page = BlankPage(AppFrame(client=self.client))
+        page = BlankPage(self.frame)
         self.assertEqual(page.page_title, "")
         self.assertTrue(page.page_usage.startswith(""))
         self.assertEqual(page.page_status, "")
@@ -155,48 +157,39 @@ class TestCliPages(TestBase):
         Test that a ticket list app page satisfies the AppPage interface.
         """
 
-        page = TicketListPage(AppFrame(client=self.client))
+        page = TicketListPage(self.frame)
         self.assertEqual(page.page_title, "Ticket List")
         self.assertTrue(page.page_usage.startswith("UP / DOWN"))
         # TODO: finish and test this
         self.assertEqual(page.page_status, "")
 
-    def test_ticket_list_render_initial(self):
-
-        ticket_list = TicketListPage(AppFrame(client=self.client))
+    def _paging_content(self, screen_size, keys, final_size=None):
+        """
+        Render a ticket list, send `keys`, and return the final canvas text.
 
-        screen_size = (50, 10)
+        Shares the page construction logic between every paging case.
+        """
+        ticket_list = TicketListPage(self.frame)
+        ticket_list.render(screen_size, True)
+        _send_keys(ticket_list, screen_size, keys)
+        composite = ticket_list.render(final_size or screen_size, True)
+        return _canvas_text(composite)
 
-        composite = ticket_list.render(screen_size, True)
-        text_content = list(
-            text for _, _, text in itertools.chain(*composite.content())
-        )
-        self.assertEqual(text_content, self.list_content_start)
+    def test_ticket_list_render_initial(self):
+        text_content = self._paging_content((50, 10), [])
+        self.assertEqual(text_content, list(LIST_CONTENT_START))
 
     def test_ticket_list_render_paging_small(self):
         """
         Capture the case where previously, bounds were not checked correctly for
         highlighted_index.
         """
-
-        screen_size = (50, 10)
-
-        ticket_list = TicketListPage(AppFrame(client=self.client))
-        ticket_list.render(screen_size, True)
-        ticket_list.keypress(screen_size, 'page down')
-        ticket_list.keypress(screen_size, 'page down')
-        ticket_list.keypress(screen_size, 'page up')
-        ticket_list.keypress(screen_size, 'page up')
-        ticket_list.keypress(screen_size, 'down')
-
-        composite = ticket_list.render(screen_size, True)
-        text_content = list(
-            text for _, _, text in itertools.chain(*composite.content())
+        text_content = self._paging_content(
+            (50, 10),
+            ['page down', 'page down', 'page up', 'page up', 'down']
         )
 
-        expected = copy(self.list_content_start)
-        expected[5] = b' '
-        expected[10] = b'>'
+        expected = _expected_with(LIST_CONTENT_START, {5: b' ', 10: b'>'})
         self.assertEqual(text_content, expected)
 
     def test_ticket_list_render_paging_hard(self):
@@ -204,48 +197,27 @@ class TestCliPages(TestBase):
         Capture the edge case where the last page has less visible tickets
         than the previous page, causing selected_index to fall off visible tickets.
         """
-
-        screen_size = (50, 38)
-
-        ticket_list = TicketListPage(AppFrame(client=self.client))
-        ticket_list.render(screen_size, True)
-        ticket_list.keypress(screen_size, 'page down')
-        ticket_list.keypress(screen_size, 'page down')
-        ticket_list.keypress(screen_size, 'page down')
+        self._paging_content((50, 38), ['page down'] * 3)
 
     def test_ticket_list_render_paging_resize(self):
         """
         Capture the edge case where a widget is resized after scrolling to the
         bottom.
         """
-
-        screen_size = (50, 38)
-
-        ticket_list = TicketListPage(AppFrame(client=self.client))
-        ticket_list.render(screen_size, True)
-        ticket_list.keypress(screen_size, 'page down')
-        ticket_list.keypress(screen_size, 'page down')
-        ticket_list.keypress(screen_size, 'page down')
-
-        screen_size = (50, 10)
-
-        composite = ticket_list.render(screen_size, True)
-        text_content = list(
-            text for _, _, text in itertools.chain(*composite.content())
+        text_content = self._paging_content(
+            (50, 38), ['page down'] * 3, final_size=(50, 10)
         )
-        self.assertEqual(text_content, self.list_content_end)
+        self.assertEqual(text_content, list(LIST_CONTENT_END))
 
     def test_ticket_view_render_blank(self):
 
-        ticket_view = TicketViewPage(AppFrame(client=self.client))
+        ticket_view = TicketViewPage(self.frame)
 
         screen_size = (50, 10)
 
         composite = ticket_view.render(screen_size, True)
-        text_content = list(
-            text for _, _, text in itertools.chain(*composite.content())
-        )
-        self.assertEqual(text_content, self.view_content_init)
+        text_content = _canvas_text(composite)
+        self.assertEqual(text_content, list(VIEW_CONTENT_INIT))
 
 class TestCliApp(TestBase):
     @classmethod
@@ -258,9 +230,7 @@ class TestCliApp(TestBase):
         screen_size = (50, 10)
         composite = frame.render(screen_size, True)
 
-        text_content = list(
-            text for _, _, text in itertools.chain(*composite.content())
-        )
+        text_content = _canvas_text(composite)
 
         self.assertEqual(text_content, [
         	b'Test App         ', b'                 ', b'                ',
@@ -1,21 +1,19 @@
+import json
+import pickle
 import shlex
+import tempfile
 import unittest
 import os
+from unittest import mock
 
 import requests
 
 import configargparse
 from context import TEST_DATA_DIR
-from six import MovedModule, add_move
 from zendesk_ticket_viewer.core import (get_client, get_config,
                                         validate_connection, critical_error_exit)
 from zendesk_ticket_viewer.exceptions import ZTVConfigException
 
-if True:
-    # Ensure certain libraries can be imported the same way in PY2/3
-    add_move(MovedModule('mock', 'mock', 'unittest.mock'))
-    from six.moves import mock
-
 class TestBase(unittest.TestCase):
     """
     Base test case containing useful
@@ -64,23 +62,24 @@ class TestMainMocked(TestBase):
         self.assertEqual(config.email, self.dummy_email)
         self.assertEqual(config.password, self.dummy_password)
 
-    @mock.patch('requests.Session')
-    def mock_validate_connection(self, subdomain, status_code, session_mock):
+    def mock_validate_connection(self, subdomain, status_code):
         """
-        Validate cinnection using a session with a mocked status_code.
+        Validate connection using a session with a mocked status_code.
+
+        `validate_connection` accepts a session argument, so a mock session
+        is passed in directly instead of patching `requests.Session` which
+        is considerably slower per invocation.
 
         Args:
             subdomain (str): The subdomain which is being tested
             status_code (int): the status code which is always returned by
                 the mocked session
-            session_mock : Provided by the mock.patch decorator
         """
         mock_response = requests.Response()
         mock_response.status_code = status_code
-        session_mock.return_value = mock.MagicMock(get=mock.MagicMock(
+        session = mock.MagicMock(head=mock.MagicMock(
             return_value=mock_response
         ))
-        session = requests.Session()
         config = configargparse.Namespace()
         config.subdomain = subdomain
         validate_connection(config, session)
@@ -107,6 +106,37 @@ class TestMainMocked(TestBase):
         self.assertEqual(api.tickets.subdomain, config.subdomain)
         self.assertEqual(api.tickets.session.auth, (config.email, config.password))
 
+    def test_get_client_legacy_pickle(self):
+        """
+        Regression test: baseline --pickle-tickets output (a protocol-2
+        list of JSON strings) must still load through get_client.
+        """
+        ticket_dicts = [
+            {'id': 1, 'subject': 'legacy format'},
+            {'id': 2, 'subject': 'still loads'},
+        ]
+        with tempfile.NamedTemporaryFile(
+            suffix='.pkl', delete=False
+        ) as pickle_file:
+            pickle.dump(
+                [json.dumps(ticket_dict) for ticket_dict in ticket_dicts],
+                pickle_file, protocol=2
+            )
+        self.addCleanup(os.remove, pickle_file.name)
+
+        config = configargparse.Namespace(
+            subdomain=self.dummy_subdomain,
+            email=self.dummy_email,
+            password=self.dummy_password,
+            unpickle_tickets=True,
+            pickle_path=pickle_file.name
+        )
+        api = get_client(config)
+        cache = api.tickets.cache.mapping['ticket']
+        self.assertEqual(len(cache), len(ticket_dicts))
+        self.assertEqual(cache[1].subject, 'legacy format')
+        self.assertEqual(cache[2].subject, 'still loads')
+
     def test_critical_error_exit(self):
         with self.assertRaises(SystemExit):
             critical_error_exit('message', ZTVConfigException('details'))
@@ -1,6 +1,5 @@
 """Provide entrypoint for package."""
 
-from .cli.app import ZTVApp
 from .core import get_config, setup_logging
 
 
@@ -10,7 +9,10 @@ def main():
 
     setup_logging(config)
 
-    # hand over to cli
+    # hand over to cli, deferring the urwid import until it is needed
+    # so that `--help` doesn't pay for it
+
+    from .cli.app import ZTVApp
 
     ztv_app = ZTVApp(config=config)
     ztv_app.run()
@@ -4,51 +4,74 @@ Provide Command Line Interface for the package using the urwid library.
 
 from __future__ import unicode_literals
 
-from collections import OrderedDict
+import functools
 
 import configargparse
 import urwid
-from urwid.compat import with_metaclass
 
 from ..core import PKG_LOGGER
 from .pages import (AppElementMixin, BlankPage, ErrorPage, TicketListPage,
-                    TicketViewPage, WelcomePage)
+                    WelcomePage)
 
-# TODO: remove numpy dependency, it takes forever to install on WSL'
+
+def _format_id(value):
+    """Pad the ticket id away from the right-aligned column edge."""
+    return "{} ".format(value)
+
+
+# type / priority take a handful of distinct values, so their formatted
+# output is memoized rather than recomputed per cell
+@functools.lru_cache(maxsize=64)
+def _format_type(value):
+    return (value or 'ticket').title()
+
+
+@functools.lru_cache(maxsize=64)
+def _format_priority(value):
+    return value or '-'
 
 
 class AppFrame(urwid.Frame, AppElementMixin):
     """Provide a Frame widget to house a multi-page app."""
 
-    column_meta = OrderedDict([
-        ('id', {
+    # plain dicts preserve insertion order on all supported Pythons, so no
+    # need for the heavier OrderedDict here
+    column_meta = {
+        'id': {
             'title': 'Ticket #',
             'sizing': ['fixed', 9],
             'align': 'right',
-            'formatter': (lambda x: "{} ".format(x))
-        }),
-        ('subject', {
+            'formatter': _format_id
+        },
+        'subject': {
             'sizing': ['weight', 2],
-        }),
-        ('assignee_id', {
+        },
+        'assignee_id': {
             'title': 'Assignee',
             'list_view': False,
-        }),
-        ('tags', {
+        },
+        'tags': {
             'list_view': False,
-            'formatter': (lambda x: ', '.join(x))
-        }),
-        ('type', {
-            'formatter': (lambda x: (x or 'ticket').title())
-        }),
-        ('priority', {
-            'formatter': (lambda x: x or '-')
-        }),
-        ('description', {
+            'formatter': ', '.join
+        },
+        'type': {
+            'formatter': _format_type
+        },
+        'priority': {
+            'formatter': _format_priority
+        },
+        'description': {
             'list_view': False
-        }),
+        },
         # TODO: conversations
-    ])
+    }
+
+    # Precomputed (key, meta) pairs for the columns shown in the list view,
+    # so pages don't re-filter column_meta on construction.
+    list_view_meta = tuple(
+        (key, meta) for key, meta in column_meta.items()
+        if meta.get('list_view', True)
+    )
 
     key_actions = {
         'esc': 'back',
@@ -68,7 +91,12 @@ class AppFrame(urwid.Frame, AppElementMixin):
         self.client = client
         # App event loop
         self.loop = kwargs.pop('loop', None)
-        self.__super.__init__(
+        # Last text pushed to the header / footer widgets, so refreshes can
+        # compare against plain strings instead of urwid text properties
+        self._last_title = None
+        self._last_usage = None
+        self._last_status = None
+        super().__init__(
             header=self.initial_header_widget(),
             body=self.current_page,
             footer=self.initial_footer_widget(),
@@ -134,17 +162,22 @@ class AppFrame(urwid.Frame, AppElementMixin):
         """Check before refreshing header / footer status widgets."""
         # TODO: update the text on the header / footer widgets with the latest
         # info from the current page app.
-        self.current_page.refresh_widgets(size)
         current_page = self.current_page
+        if not current_page._refresh_noop:
+            current_page.refresh_widgets(size)
         if self.body != current_page:
             self.body = current_page
-        _, (wg_page_title, _), (wg_page_usage, _) = self.header.contents
-        if wg_page_title.text != current_page.page_title:
-            wg_page_title.set_text(current_page.page_title)
-        if wg_page_usage.text != current_page.page_usage:
-            wg_page_usage.set_text(current_page.page_usage)
-        if self.footer.text != current_page.page_status:
-            self.footer.text = current_page.page_status
+        if self._last_title != current_page.page_title:
+            self._last_title = current_page.page_title
+            _, (wg_page_title, _), _ = self.header.contents
+            wg_page_title.set_text(self._last_title)
+        if self._last_usage != current_page.page_usage:
+            self._last_usage = current_page.page_usage
+            _, _, (wg_page_usage, _) = self.header.contents
+            wg_page_usage.set_text(self._last_usage)
+        if self._last_status != current_page.page_status:
+            self._last_status = current_page.page_status
+            self.footer.text = self._last_status
 
     def _action_back(self, *_):
         """Go back to the previous page."""
@@ -162,20 +195,21 @@ class AppFrame(urwid.Frame, AppElementMixin):
         # always focussed on the body
         # self.body.keypress(size, key)
         self._mix_keypress(size, key)
-        self.__super.keypress(size, key)
+        super().keypress(size, key)
 
     def render(self, size, focus=False):
         """Wrap super and mixin `render`s."""
-        PKG_LOGGER.debug("current page is {}".format(self.current_page_id))
+        page_id = self.current_page_id
+        PKG_LOGGER.debug("current page is %s", page_id)
         self._mix_render(size, focus)
 
-        if self.loop is not None and self.current_page_id == 'BLANK':
+        if self.loop is not None and page_id == 'BLANK':
             raise urwid.ExitMainLoop()
 
-        return self.__super.render(size, focus)
+        return super().render(size, focus)
 
 
-class ZTVApp(with_metaclass(urwid.MetaSuper, urwid.MainLoop)):
+class ZTVApp(urwid.MainLoop):
     """Provide CLI app event loop functionality."""
 
     palette = [
@@ -209,7 +243,7 @@ class ZTVApp(with_metaclass(urwid.MetaSuper, urwid.MainLoop)):
         )
         self.frame.add_page('WELCOME', WelcomePage)
         self.frame.add_page('TICKET_LIST', TicketListPage)
-        self.frame.add_page('TICKET_VIEW', TicketViewPage)
+        # TICKET_VIEW is added lazily when a ticket is first opened
         self.frame.add_page('ERROR', ErrorPage)
         self.frame.set_page('WELCOME')
         if getattr(self.config, 'unpickle_tickets'):
@@ -217,6 +251,6 @@ class ZTVApp(with_metaclass(urwid.MetaSuper, urwid.MainLoop)):
             self.frame.pages['WELCOME']._action_login()
             del self.frame.pages['WELCOME']
 
-        self.__super.__init__(
+        super().__init__(
             widget=self.frame, palette=self.palette, screen=self.screen,
         )
@@ -1,35 +1,42 @@
 """Provide pages for Command line interface App."""
 
-import functools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
-import numpy
 import six
 import urwid
-from urwid.compat import with_metaclass
 
 from ..core import PKG_LOGGER, get_client, validate_connection
 from ..util import wrap_connection_error
 from .widgets import (FormFieldHorizontal, FormFieldHorizontalEdit,
                       FormFieldHorizontalPass, TicketCell, TicketColumn)
 
-ZENDESK_LOGO = \
-    " `////////////////.  :///////////////.  \n" + \
-    "  mNNNNNNNNNNNNNNN-  dNNNNNNNNNNNNNm/   \n" + \
-    "  -mNNNNNNNNNNNNN+   dNNNNNNNNNNNNs`    \n" + \
-    "   .smNNNNNNNNNh-    dNNNNNNNNNNh.      \n" + \
-    "     `:+syyso/`  ::  dNNNNNNNNm/        \n" + \
-    "               .yN+  dNNNNNNNo`         \n" + \
-    "              +NNN+  dNNNNNh.           \n" + \
-    "            :dNNNN+  dNNNm:             \n" + \
-    "          .yNNNNNN+  dNNo`              \n" + \
-    "        `oNNNNNNNN+  dy.     `          \n" + \
-    "       :mNNNNNNNNN+  -  -ohmNNNmho-     \n" + \
-    "     .hNNNNNNNNNNN+   -hNNNNNNNNNNNh-   \n" + \
-    "   `oNNNNNNNNNNNNN+  -NNNNNNNNNNNNNNN-  \n" + \
-    "  /mNNNNNNNNNNNNNN+  yNNNNNNNNNNNNNNNy\ "
-
-
-class AppElementMixin(with_metaclass(urwid.MetaSuper)):
+ZENDESK_LOGO = "\n".join((
+    " `////////////////.  :///////////////.  ",
+    "  mNNNNNNNNNNNNNNN-  dNNNNNNNNNNNNNm/   ",
+    "  -mNNNNNNNNNNNNN+   dNNNNNNNNNNNNs`    ",
+    "   .smNNNNNNNNNh-    dNNNNNNNNNNh.      ",
+    "     `:+syyso/`  ::  dNNNNNNNNm/        ",
+    "               .yN+  dNNNNNNNo`         ",
+    "              +NNN+  dNNNNNh.           ",
+    "            :dNNNN+  dNNNm:             ",
+    "          .yNNNNNN+  dNNo`              ",
+    "        `oNNNNNNNN+  dy.     `          ",
+    "       :mNNNNNNNNN+  -  -ohmNNNmho-     ",
+    "     .hNNNNNNNNNNN+   -hNNNNNNNNNNNh-   ",
+    "   `oNNNNNNNNNNNNN+  -NNNNNNNNNNNNNNN-  ",
+    "  /mNNNNNNNNNNNNNN+  yNNNNNNNNNNNNNNNy\\ ",
+))
+
+
+def _clip(value, lower, upper):
+    """Constrain scalar `value` to the inclusive range [`lower`, `upper`]."""
+    return max(lower, min(value, upper))
+
+
+class AppElementMixin(object):
     """
     Functionality common to app elements.
 
@@ -40,44 +47,61 @@ class AppElementMixin(with_metaclass(urwid.MetaSuper)):
     # A mapping of keys to actions (override this).
     key_actions = {}
 
+    # True on elements whose refresh_widgets is a no-op, letting containers
+    # skip the call entirely.
+    _refresh_noop = True
+
     def refresh_widgets(self, size):
         pass
 
     def _mix_render(self, size, focus=False):
         """Wrap super `render` to refresh widgets."""
-        PKG_LOGGER.debug('{} rendering, size={} focus={}'.format(
+        PKG_LOGGER.debug(
+            '%s rendering, size=%s focus=%s',
             self.__class__.__name__, size, focus
-        ))
+        )
         self.refresh_widgets(size)
 
     def _mix_keypress(self, size, key):
         """Wrap super `keypress` to refresh widgets."""
-        PKG_LOGGER.debug('{} keypress, size={} key={}'.format(
-            self.__class__.__name__, size, repr(key)
-        ))
+        PKG_LOGGER.debug(
+            '%s keypress, size=%s key=%r',
+            self.__class__.__name__, size, key
+        )
 
         # TODO: replace logic with urwid.command_map ?
 
-        if key in self.key_actions:
-            getattr(self, '_action_{}'.format(self.key_actions[key]))(
-                size, key
-            )
+        dispatch = self.__dict__.get('_key_dispatch')
+        if dispatch is None:
+            # bind the action methods once instead of getattr per keystroke
+            dispatch = self._key_dispatch = {
+                key_: getattr(self, '_action_' + action)
+                for key_, action in self.key_actions.items()
+            }
+        action = dispatch.get(key)
+        if action is not None:
+            action(size, key)
 
         self.refresh_widgets(size)
 
     def _action_exit(self, *_):
         raise urwid.ExitMainLoop()
 
-    def _get_markup(self, ticket_dict, key, formatter=None):
-        formatter = formatter or id
-
-        unformatted = ticket_dict.get(key, '')
+    def _get_markup(self, ticket, key, formatter=str):
+        """Format one field of a ticket (or of None, for a blank row)."""
+        unformatted = getattr(ticket, key, '')
+        if unformatted is None:
+            unformatted = ''
         try:
             return formatter(unformatted)
         except UnicodeEncodeError:
             if not isinstance(unformatted, six.text_type):
                 unformatted = six.text_type(unformatted)
-            unformatted = (unformatted).encode('ascii', errors='ignore')
+            # strip non-ascii but stay in the text domain, otherwise the
+            # formatter would stringify a bytes object ("b'...'")
+            unformatted = unformatted.encode(
+                'ascii', errors='ignore'
+            ).decode('ascii')
             return formatter(unformatted)
 
     def modal_fatal_error(self, message=None, exc=None):
@@ -108,7 +132,7 @@ class AppPageMixin(AppElementMixin):
     def __init__(self):
         """Wrap super __init__ as per `urwid.MetaClass` spec."""
         assert self.parent_frame
-        self.__super.__init__()
+        super().__init__()
 
     @property
     def page_usage(self):
@@ -132,7 +156,7 @@ class BlankPage(urwid.ListBox, AppPageMixin):
     def __init__(self, parent_frame, *args, **kwargs):
         """Wrap super `__init__` with extra metadata."""
         self.parent_frame = parent_frame
-        self.__super.__init__(urwid.SimpleListWalker([]))
+        super().__init__(urwid.SimpleListWalker([]))
 
 
 def mix_render_keypress(cls):
@@ -163,8 +187,11 @@ class TicketListPage(urwid.Columns, AppPageMixin):
     """An app page which displays a table of ticket information."""
 
     _selectable = True
+    _refresh_noop = False
     header_size = 1
     footer_size = 0
+    # cap on cached tickets; old entries are evicted once exceeded
+    cache_maxlen = 4096
     # how quickly the scrolls when paging
     page_speed = 1
     _usage = (
@@ -183,10 +210,31 @@ class TicketListPage(urwid.Columns, AppPageMixin):
         'page down': 'scroll',
     }
 
+    # Fixed scroll movement per key; page keys scale with the window size
+    _KEY_MOVEMENTS = {
+        'up': -1,
+        'down': 1,
+    }
+
     def __init__(self, parent_frame, *args, **kwargs):
         """Wrap super `__init__` with extra metadata."""
-        # Cache access to generator to avoid api calls
-        self._ticket_cache = []
+        # Cache access to generator to avoid api calls. Bounded so memory
+        # stays O(window) on accounts with very many tickets.
+        self._ticket_cache = deque(maxlen=self.cache_maxlen)
+        # Absolute ticket index of the first cache entry (advances once the
+        # deque starts evicting)
+        self._cache_base = 0
+        # Guards generator consumption / cache appends across threads
+        self._cache_lock = threading.Lock()
+        # Single worker keeps API pages arriving in order
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        self._prefetch_future = None
+        self._generator_exhausted = False
+        # (message, exc) recorded by a failed prefetch, surfaced by the
+        # next UI-thread refresh
+        self._pending_error = None
+        # Fingerprint of the last refresh, to skip no-op re-renders
+        self._last_render_key = None
         # Offset into the generator of the first visible element
         self.offset = 0
         # Index of the highlighted element
@@ -195,7 +243,7 @@ class TicketListPage(urwid.Columns, AppPageMixin):
         kwargs['dividechars'] = 0
         self.parent_frame = parent_frame
         self._ticket_generator = None
-        self.__super.__init__(
+        super().__init__(
             self.initial_column_widgets(), *args, **kwargs
         )
 
@@ -213,32 +261,13 @@ class TicketListPage(urwid.Columns, AppPageMixin):
             self._ticket_generator = cache.values().__iter__()
         else:
             self._ticket_generator = wrap_connection_error(
-                functools.partial(client.tickets, timeout=5),
+                lambda: client.tickets(timeout=5),
                 attempting="Connecting to API",
-                on_fail=functools.partial(self.modal_fatal_error),
-                on_success=functools.partial(
-                    PKG_LOGGER.info, "Connected to API"
-                )
+                on_fail=self.modal_fatal_error,
+                on_success=lambda: PKG_LOGGER.info("Connected to API")
             )
         return self._ticket_generator
 
-    @property
-    def next_ticket(self):
-        # get before wrap so that we don't wrap twice
-        generator = self.ticket_generator
-        if generator is None:
-            # want to exit getting ticket_generator cleanly in case there
-            # was an error that needs to be displayed
-            raise StopIteration()
-        response = wrap_connection_error(
-            injected=functools.partial(next, generator),
-            attempting="Making an API request",
-            on_fail=functools.partial(self.modal_fatal_error),
-        )
-        if response is None:
-            raise StopIteration()
-        return response
-
     @property
     def nonbody_overhead(self):
         """Rows taken up by the header and footer."""
@@ -255,24 +284,36 @@ class TicketListPage(urwid.Columns, AppPageMixin):
         Generate the initial list of column widgets.
 
         Widget size is not known until render time, so no ticket entries are
-        added to the widget list initially.
+        added to the widget list initially. Each column gets a persistent
+        walker whose cells are mutated in place on refresh instead of being
+        rebuilt, plus a (formatter, align) spec snapshotted here since
+        column_meta never changes after setup.
         """
+        self._cell_walkers = {}
+        self._col_specs = {'_selected': (str, urwid.LEFT)}
+
+        def column_walker(key):
+            walker = urwid.SimpleListWalker([])
+            self._cell_walkers[key] = walker
+            return walker
+
         # First column is a selection indicator
         widget_list = [
             ('fixed', 1, TicketColumn(
                 header=urwid.Divider(),
-                body=urwid.Divider(),
+                body=urwid.ListBox(column_walker('_selected')),
                 key='_selected'
             ))
         ]
         # Other widget columns show ticket data
-        for key, meta in self.parent_frame.column_meta.items():
-            if 'list_view' in meta and not meta['list_view']:
-                continue
+        for key, meta in self.parent_frame.list_view_meta:
             title = meta.get('title', key.title())
+            self._col_specs[key] = (
+                meta.get('formatter', str), meta.get('align', urwid.LEFT)
+            )
             column_widget = TicketColumn(
                 header=TicketCell(title),
-                body=urwid.ListBox(urwid.SimpleListWalker([])),
+                body=urwid.ListBox(column_walker(key)),
                 key=key
             )
             if 'sizing' in meta:
@@ -281,78 +322,153 @@ class TicketListPage(urwid.Columns, AppPageMixin):
 
         return widget_list
 
+    @property
+    def _cache_end(self):
+        """Absolute ticket index just past the last cache entry."""
+        return self._cache_base + len(self._ticket_cache)
+
+    def _defer_fatal_error(self, message, exc):
+        """Park a fetch failure until the next UI-thread refresh.
+
+        `modal_fatal_error` mutates page state, which is only safe on the
+        UI thread, and `_fill_cache` may be running on the prefetch worker.
+        """
+        self._pending_error = (message, exc)
+
+    def _fill_cache(self, target):
+        """Consume the generator until the cache covers ticket `target`.
+
+        Tickets are drained in one batch per call rather than one wrapped
+        `next()` per row, so the error-handling ceremony is paid per fetch
+        instead of per ticket.
+        """
+        generator = self.ticket_generator
+        if generator is None:
+            # an error page is already being displayed
+            self._generator_exhausted = True
+            return
+        while self._cache_end < target:
+            with self._cache_lock:
+                needed = target - self._cache_end
+                if needed <= 0:
+                    continue
+                batch = wrap_connection_error(
+                    injected=lambda: list(islice(generator, needed)),
+                    attempting="Making an API request",
+                    on_fail=self._defer_fatal_error,
+                ) or []
+                overflow = (
+                    len(self._ticket_cache) + len(batch) - self.cache_maxlen
+                )
+                if overflow > 0:
+                    # the extend below evicts the oldest entries
+                    self._cache_base += overflow
+                self._ticket_cache.extend(batch)
+                if len(batch) < needed:
+                    self._generator_exhausted = True
+                    break
+
     def get_tickets(self, offset, limit):
         """
         Fetch `limit` tickets from the generator starting at `offset`.
 
-        Prefetch and cache 2 * `limit` tickets from the API.
+        The visible window is filled synchronously; a further 4 * `limit`
+        tickets are prefetched on a worker thread so that scrolling past
+        the cached window doesn't block the UI on an API round-trip.
 
         Args
         ----
             offset (:obj:`int`): the index of the first ticket required
             limit (:obj:`int`): the number of tickets required
         """
-        prefetch_index = 2 * (limit) + offset
+        if self.ticket_generator is not None and not self._generator_exhausted:
+            self._fill_cache(offset + limit)
+            prefetch_index = 4 * limit + offset
+            if (
+                not self._generator_exhausted
+                and self._cache_end < prefetch_index
+            ):
+                future = self._prefetch_future
+                if future is None or future.done():
+                    self._prefetch_future = self._prefetch_executor.submit(
+                        self._fill_cache, prefetch_index
+                    )
+        # snapshot under the lock: iterating the deque while the prefetch
+        # worker extends it raises "deque mutated during iteration"
+        with self._cache_lock:
+            start = max(offset - self._cache_base, 0)
+            return list(islice(self._ticket_cache, start, start + limit))
+
+    def _refresh_column(self, key, visible_tickets, index_highlighted):
+        """Mutate the persistent cells of a column to match the tickets."""
+        formatter, align = self._col_specs[key]
+
+        cells = self._cell_walkers[key]
+        # grow / shrink the cell pool only when the window size changes
+        while len(cells) < len(visible_tickets):
+            cells.append(
+                urwid.AttrWrap(TicketCell('', align=align), 'column')
+            )
+        del cells[len(visible_tickets):]
 
-        try:
-            while self.ticket_generator is not None:
-                if prefetch_index < len(self._ticket_cache):
-                    break
-                self._ticket_cache.append(self.next_ticket)
-        except StopIteration:
-            pass
-        return self._ticket_cache[offset:offset + limit]
-
-    def _get_cell_widgets(self, key, visible_tickets, index_highlighted):
-        meta = self.parent_frame.column_meta.get(key, {})
-        formatter = meta.get('formatter', str)
-        cell_kwargs = {
-            'align': meta.get('align', urwid.LEFT)
-        }
-        cell_widgets = []
         for index, ticket in enumerate(visible_tickets):
-            cell_kwargs['markup'] = self._get_markup(
-                ticket.to_dict(), key, formatter
-            )
-            if key == '_selected' and index == index_highlighted:
-                cell_kwargs['markup'] = '>'
-            cell_widget = TicketCell(**cell_kwargs)
-            if index == index_highlighted:
-                cell_widget = urwid.AttrWrap(cell_widget, 'important')
-            cell_widgets.append(cell_widget)
-        return cell_widgets
+            if key == '_selected':
+                markup = '>' if index == index_highlighted else ''
+            else:
+                markup = self._get_markup(ticket, key, formatter)
+            cell = cells[index]
+            if cell.text != markup:
+                cell.set_text(markup)
+            attr = 'important' if index == index_highlighted else 'column'
+            if cell.attr != attr:
+                cell.set_attr(attr)
 
     def refresh_widgets(self, size):
         """
         Populate frame body of each column with visible tickets.
 
+        Only cells whose text or attribute actually changed are touched, so
+        the usual refresh costs a handful of `set_text` calls rather than
+        rebuilding every cell, walker and listbox per column.
+
         Args
         ----
             size (:obj:`tuple` of :obj:`int`): The allowed size of the widget
 
         """
-        PKG_LOGGER.debug('refreshing, size={}'.format(size))
+        PKG_LOGGER.debug('refreshing, size=%s', size)
+        if self._pending_error is not None:
+            message, exc = self._pending_error
+            self._pending_error = None
+            self.modal_fatal_error(message, exc)
+            return
         self._action_scroll(size)
 
-        _, maxcol = size
+        # everything below is a pure function of this fingerprint, so a
+        # repeat render (e.g. a focus change) can skip the column updates
+        render_key = (
+            size, self.offset, self.index_highlighted, self._cache_end
+        )
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
+        # box size tuples are (maxcol, maxrow); rows bound the window
+        _, maxrow = size
         visible_tickets = self.get_tickets(
-            self.offset, maxcol - self.nonbody_overhead
+            self.offset, maxrow - self.nonbody_overhead
         )
-        index_highlighted = numpy.clip(
+        index_highlighted = _clip(
             self.index_highlighted,
             0,
-            min(maxcol - self.nonbody_overhead, len(visible_tickets)) - 1
+            min(maxrow - self.nonbody_overhead, len(visible_tickets)) - 1
         )
 
         for column, _ in self.contents:
-            cell_widgets = self._get_cell_widgets(
+            self._refresh_column(
                 column.key, visible_tickets, index_highlighted
             )
 
-            # TODO: test for memory leaks
-
-            column.body = urwid.ListBox(urwid.SimpleListWalker(cell_widgets))
-
     def _action_scroll(self, size, key=None):
         """
         Move highlighted index by `movement`, scroll `offset` at boundaries.
@@ -360,40 +476,47 @@ class TicketListPage(urwid.Columns, AppPageMixin):
         Even if movement is 0 it is useful to refresh these values since the
         widget can be resized.
         """
-        PKG_LOGGER.debug('scrolling, size={} key={}'.format(
-            size, key
-        ))
-        _, maxcol = size
-        # Map key value to scroll movement amount
-        page_jump = int(self.page_speed * (maxcol - self.nonbody_overhead))
-        key_movements = {
-            'up': -1,
-            'down': 1,
-            'page up': -page_jump,
-            'page down': page_jump
-        }
-        movement = key_movements.get(key, 0)
+        PKG_LOGGER.debug('scrolling, size=%s key=%s', size, key)
+        _, maxrow = size
+        movement = self._KEY_MOVEMENTS.get(key, 0)
+        if key in ('page up', 'page down'):
+            page_jump = int(
+                self.page_speed * (maxrow - self.nonbody_overhead)
+            )
+            movement = page_jump if key == 'page down' else -page_jump
         # move highlighted index until boundaries
-        can_move_to = numpy.clip(
+        can_move_to = _clip(
             self.index_highlighted + movement,
             0,
-            maxcol - self.nonbody_overhead - 1
+            maxrow - self.nonbody_overhead - 1
         )
         # determine remaining movement to potentially move the offset
         movement = movement - (can_move_to - self.index_highlighted)
         self.index_highlighted = can_move_to
 
-        # offset can't exceed ticket cache
-        self.offset = numpy.clip(
+        if movement > 0 and not self._generator_exhausted:
+            # user has outrun the prefetched window; block until the cache
+            # covers the scroll destination
+            self._fill_cache(self.offset + movement + 1)
+
+        # offset can't leave the cached ticket window
+        self.offset = _clip(
             self.offset + movement,
-            0,
-            max(len(self._ticket_cache) - 1, 0)
+            self._cache_base,
+            max(self._cache_end - 1, self._cache_base)
         )
 
     def _action_open(self, *_):
         """Open view of selected ticket."""
-        ticket = self._ticket_cache[self.offset + self.index_highlighted]
-        PKG_LOGGER.debug('Actioning ticket id={}'.format(ticket))
+        # locked so the index can't race a concurrent _cache_base eviction
+        with self._cache_lock:
+            ticket = self._ticket_cache[
+                self.offset + self.index_highlighted - self._cache_base
+            ]
+        PKG_LOGGER.debug('Actioning ticket id=%s', ticket)
+        if 'TICKET_VIEW' not in self.parent_frame.pages:
+            # built on first open; most sessions never need more pages
+            self.parent_frame.add_page('TICKET_VIEW', TicketViewPage)
         self.parent_frame.pages['TICKET_VIEW'].current_ticket = ticket
         self.parent_frame.set_page('TICKET_VIEW')
 
@@ -402,6 +525,7 @@ class TicketListPage(urwid.Columns, AppPageMixin):
 class TicketViewPage(urwid.ListBox, AppPageMixin):
     """An app page which displays a single ticket's information."""
 
+    _refresh_noop = False
     _usage = (
         u"ESC is back. "
         u"F8 exits."
@@ -412,7 +536,10 @@ class TicketViewPage(urwid.ListBox, AppPageMixin):
         """Wrap super `__init__` with extra metadata."""
         self.parent_frame = parent_frame
         self.current_ticket = None
-        self.__super.__init__(urwid.SimpleListWalker(
+        # sentinel that can't equal any ticket (or None), so the first
+        # refresh always runs
+        self._rendered_ticket = ()
+        super().__init__(urwid.SimpleListWalker(
             self.initial_row_widgets()
         ))
 
@@ -428,16 +555,19 @@ class TicketViewPage(urwid.ListBox, AppPageMixin):
         return widget_list
 
     def refresh_widgets(self, size):
-        """Refresh the row widgets."""
-        ticket_dict = {}
-        if self.current_ticket:
-            ticket_dict = self.current_ticket.to_dict()
+        """Refresh the row widgets when the displayed ticket changes."""
+        if self.current_ticket is self._rendered_ticket:
+            return
+        self._rendered_ticket = self.current_ticket
 
         for wg_field in self.body.contents:
-            meta = self.parent_frame.column_meta.get(wg_field.key, {})
+            # row widgets are built from column_meta, so the key always hits
+            meta = self.parent_frame.column_meta[wg_field.key]
             _, (wg_field_value, _) = wg_field.contents
             formatter = meta.get('formatter', str)
-            markup = self._get_markup(ticket_dict, wg_field.key, formatter)
+            markup = self._get_markup(
+                self.current_ticket, wg_field.key, formatter
+            )
             if wg_field_value.text != markup:
                 wg_field_value.set_text(markup)
 
@@ -445,6 +575,7 @@ class TicketViewPage(urwid.ListBox, AppPageMixin):
 @mix_render_keypress
 class ErrorPage(urwid.Overlay, AppPageMixin):
     """An app page which displays an error."""
+    _refresh_noop = False
     _usage = (
         u"F8 / ESC exits."
     )
@@ -461,17 +592,20 @@ class ErrorPage(urwid.Overlay, AppPageMixin):
         self._title = kwargs.get('error_message', 'Error')
         self.error_details = kwargs.get('error_details', 'An Error occured.')
 
-        self.__super.__init__(
-            urwid.AttrWrap(
-                urwid.LineBox(
-                    urwid.ListBox(urwid.SimpleFocusListWalker([
-                        urwid.Divider(),
-                        urwid.Text(self.error_details, align='center')
-                    ])),
-                    title=self.page_title
-                ),
-                'header'
-            ),
+        # keep direct references to the mutable inner widgets so refreshes
+        # don't have to dig them out of the widget tree every render
+        self._wg_details = urwid.Text(self.error_details, align='center')
+        line_box = urwid.LineBox(
+            urwid.ListBox(urwid.SimpleFocusListWalker([
+                urwid.Divider(),
+                self._wg_details
+            ])),
+            title=self.page_title
+        )
+        self._wg_title = line_box.title_widget
+
+        super().__init__(
+            urwid.AttrWrap(line_box, 'header'),
             self.parent_frame.current_page,
             align='center', width=('relative', 50),
             valign='middle', height=('relative', 50),
@@ -483,13 +617,10 @@ class ErrorPage(urwid.Overlay, AppPageMixin):
         self._title = value
 
     def refresh_widgets(self, *_):
-        _, (wg_top, _) = self.contents
-        wg_title = wg_top.original_widget.title_widget
-        if wg_title.text != self.page_title:
-            wg_title.set_text(self.page_title)
-        wg_details = wg_top.original_widget.original_widget.body[1]
-        if wg_details.text != self.error_details:
-            wg_details.set_text(self.error_details)
+        if self._wg_title.text != self.page_title:
+            self._wg_title.set_text(self.page_title)
+        if self._wg_details.text != self.error_details:
+            self._wg_details.set_text(self.error_details)
 
 
 @mix_render_keypress
@@ -528,7 +659,7 @@ class WelcomePage(urwid.Overlay, AppPageMixin):
             )
         ]
 
-        self.__super.__init__(
+        super().__init__(
             urwid.AttrWrap(
                 urwid.LineBox(
                     urwid.ListBox(urwid.SimpleFocusListWalker(
@@ -551,27 +682,22 @@ class WelcomePage(urwid.Overlay, AppPageMixin):
             )
             if wg_field.key == 'password':
                 value = "*" * len(value)
-            PKG_LOGGER.info("updated config[{}] = {}".format(
-                wg_field.key, value
-            ))
+            PKG_LOGGER.info("updated config[%s] = %s", wg_field.key, value)
 
         # The Ticket Viewer should handle the API being unavailable
-        wrap_connection_error(
-            functools.partial(validate_connection, self.parent_frame.config),
+        session = wrap_connection_error(
+            lambda: validate_connection(self.parent_frame.config),
             attempting="Validate connection",
-            on_fail=functools.partial(self.modal_fatal_error),
-            on_success=functools.partial(
-                PKG_LOGGER.info, "Connection validated"
-            )
+            on_fail=self.modal_fatal_error,
+            on_success=lambda: PKG_LOGGER.info("Connection validated")
         )
 
+        # reuse the validated session (and its connection pool) for the client
         self.parent_frame.client = wrap_connection_error(
-            functools.partial(get_client, self.parent_frame.config),
+            lambda: get_client(self.parent_frame.config, session=session),
             attempting="Create client",
-            on_fail=functools.partial(self.modal_fatal_error),
-            on_success=functools.partial(
-                PKG_LOGGER.info, "Client created"
-            )
+            on_fail=self.modal_fatal_error,
+            on_success=lambda: PKG_LOGGER.info("Client created")
         )
 
         # if no error screen is showing
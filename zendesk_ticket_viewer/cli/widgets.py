@@ -7,7 +7,7 @@ class TicketCell(urwid.Text):
     def __init__(self, *args, **kwargs):
         """Wrap super `__init__`, force clipping on cell elements."""
         kwargs['wrap'] = urwid.CLIP
-        self.__super.__init__(*args, **kwargs)
+        super().__init__(*args, **kwargs)
 
 
 class TicketColumn(urwid.Frame):
@@ -28,7 +28,7 @@ class TicketColumn(urwid.Frame):
         if header is not None:
             header = urwid.AttrWrap(header, 'column_header')
 
-        self.__super.__init__(body, header, *args, **kwargs)
+        super().__init__(body, header, *args, **kwargs)
 
 
 class FormFieldHorizontal(urwid.Columns):
@@ -60,7 +60,7 @@ class FormFieldHorizontal(urwid.Columns):
         self._val_kwargs.update(kwargs.pop('val_kwargs', {}))
 
         kwargs['dividechars'] = 1
-        self.__super.__init__(
+        super().__init__(
             self.initial_widget_list(),
             *args, **kwargs
         )
@@ -98,12 +98,12 @@ class FormFieldHorizontalPass(FormFieldHorizontalEdit):
         """Wrap __init__ so field_value is edit_text, not caption."""
         kwargs['val_kwargs'] = {'edit_text': field_value or ''}
         field_value = ''
-        self.__super.__init__(field_label, field_value, *args, **kwargs)
+        super().__init__(field_label, field_value, *args, **kwargs)
 
     def get_value_text(self):
         _, (wg_value, _) = self.contents
         old_mask = wg_value._mask
         wg_value.set_mask(None)
-        response = self.__super.get_value_text()
+        response = super().get_value_text()
         wg_value.set_mask(old_mask)
         return response
@@ -1,30 +1,46 @@
 """Provide core functionality to zendesk_ticket_viewer module."""
 
-from __future__ import division, print_function, unicode_literals
-
+import functools
 import json
 import logging
 import pickle
 import sys
 import time
 
-import requests
-
 import configargparse
-import urwid
-import zenpy
-from zenpy import Zenpy
 
 from . import PKG_NAME
 from .exceptions import ZTVConfigException
 
 PKG_LOGGER = logging.getLogger(PKG_NAME)
 
-
-def get_config(argv=None):
-    """Parse arguments from cli, env and config files."""
-    argv = sys.argv[1:] if argv is None else argv
-
+# --verbosity is restricted to these names at parse time, so the lookup
+# in setup_logging can never fail
+_LEVEL_MAP = {
+    'CRITICAL': logging.CRITICAL,
+    'ERROR': logging.ERROR,
+    'WARNING': logging.WARNING,
+    'INFO': logging.INFO,
+    'DEBUG': logging.DEBUG,
+}
+
+# Single shared session so that every HTTP request in the process reuses
+# the same connection pool, created lazily on first use.
+_SESSION = None
+
+
+def _get_session():
+    """Return the shared `requests.Session`, creating it if necessary."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+    return _SESSION
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Construct the argument parser once; it is reusable across parses."""
     parser = configargparse.ArgumentParser(
         description="View Zendesk support ticket information",
     )
@@ -60,8 +76,22 @@ def get_config(argv=None):
         default='tests/test_data/tickets.pkl'
     )
 
-    config = parser.parse_args(argv)
+    return parser
+
+
+def get_config(argv=None):
+    """Parse arguments from cli, env and config files."""
+    argv = sys.argv[1:] if argv is None else argv
 
+    config = _build_parser().parse_args(argv)
+    # precompute the credential-independent probe URL once at config time
+    # rather than formatting it on every validate_connection call. The
+    # subdomain is stored alongside so the URL can be invalidated if the
+    # login form later rewrites config.subdomain.
+    config._validate_url = (
+        config.subdomain,
+        'https://%s.zendesk.com/access/unauthenticated' % config.subdomain
+    ) if config.subdomain else None
     return config
 
 
@@ -72,11 +102,15 @@ def critical_error_exit(message=None, exc=None):
     Present the message to the user in full screen and is display until an
     input is received.
     """
+    # deferred so that paths which never hit a fatal error (like `--help`)
+    # don't pay for the urwid import
+    import urwid
+
     # log as critical first in case urwid doesn't work
     message = "Failure in %s" % message if message else "Fatal Error"
     logging.critical(message)
     if exc:
-        logging.critical("{} {}".format(exc.__class__, exc))
+        logging.critical("%s %s", exc.__class__, exc)
 
     widget_list = [
         urwid.Divider()
@@ -96,18 +130,16 @@ def critical_error_exit(message=None, exc=None):
         urwid.Divider(),
     ])
 
-    screen = urwid.raw_display.Screen()
-
-    maxcol, maxrow = screen.get_cols_rows()
-
+    # relative sizing lets urwid handle the terminal dimensions, so no need
+    # to probe a throwaway Screen for cols / rows
     box = urwid.Overlay(
         urwid.LineBox(
             urwid.ListBox(urwid.SimpleFocusListWalker(widget_list)),
             title=message,
         ),
         urwid.SolidFill('/'),
-        align='center', width=maxcol//2,
-        valign='middle', height=maxrow//2
+        align='center', width=('relative', 50),
+        valign='middle', height=('relative', 50)
     )
 
     def stop_nowish(*args):
@@ -116,7 +148,6 @@ def critical_error_exit(message=None, exc=None):
 
     loop = urwid.MainLoop(
         widget=box,
-        screen=screen,
         unhandled_input=stop_nowish
     )
     try:
@@ -139,13 +170,7 @@ def setup_logging(config):
         config (:obj:`configargparse.Namespace`): the config namespace which
             must contain `verbosity` (str) and `log_file` (str) attributes
     """
-    try:
-        PKG_LOGGER.setLevel(getattr(logging, config.verbosity))
-    except Exception as exc:
-        critical_error_exit("invalid log level string: %s\n%s" % (
-            config.verbosity,
-            exc
-        ))
+    PKG_LOGGER.setLevel(_LEVEL_MAP[config.verbosity])
     file_handler = logging.FileHandler(config.log_file)
     file_handler.setFormatter(
         logging.Formatter('%(asctime)s %(name)s %(levelname)s %(message)s')
@@ -177,6 +202,11 @@ def validate_connection(config, session=None):
         session (:obj:`requests.Session`, optional): The session object through
             which connections are made (makes mocking easier).
 
+    Returns
+    -------
+        :obj:`requests.Session`: The session used for the probe, so callers
+            can reuse its connection pool when creating an API client.
+
     Raises
     ------
         ZTVConfigException: If an invalid subdomain has been provided.
@@ -185,36 +215,65 @@ def validate_connection(config, session=None):
 
     """
     if getattr(config, 'unpickle_tickets', None):
-        return
+        return session
 
     if not config.subdomain:
         raise ZTVConfigException("No subdomain provided")
 
     if session is None:
-        session = requests.Session()
-
-    response = session.get(
-        'https://{subdomain}.zendesk.com/access/unauthenticated'.format(
-            subdomain=config.subdomain
-        ),
-        allow_redirects=False
-    )
+        session = _get_session()
+
+    # use the precomputed URL only while it still matches config.subdomain;
+    # hand-built configs and subdomains edited on the login form fall back
+    # to formatting here
+    cached = getattr(config, '_validate_url', None)
+    if cached is not None and cached[0] == config.subdomain:
+        url = cached[1]
+    else:
+        url = ('https://%s.zendesk.com/access/unauthenticated'
+               % config.subdomain)
+
+    # only the status code matters, so a HEAD request avoids transferring
+    # the response body
+    response = session.head(url, allow_redirects=False, timeout=5)
     if response.status_code != 200:
         raise ZTVConfigException(
             "Subdomain provided does not exist: %s" % config.subdomain)
 
+    return session
+
 
 def handle_pickling(config, zenpy_client):
     """Perform pickling or unpickling as determined by config."""
+    import zenpy
+
     if getattr(config, 'unpickle_tickets', None):
         # Chose LRUCache because TTL cache deletes things
         cache = zenpy.ZenpyCache('LRUCache', maxsize=10000)
         # TODO: fill zenpy_client.tickets.cache with data from file
+        # `Ticket.__init__` assigns every field one keyword at a time; a
+        # bulk `__dict__` update is equivalent for pickled data and much
+        # faster over thousands of tickets.
+        ticket_cls = zenpy.lib.api_objects.Ticket
         with open(config.pickle_path, 'rb') as pickle_file:
-            for ticket_json in pickle.load(pickle_file):
-                ticket_dict = json.loads(ticket_json)
-                ticket = zenpy.lib.api_objects.Ticket(**ticket_dict)
-                cache[ticket.id] = ticket
+            unpickler = pickle.Unpickler(pickle_file)
+            while True:
+                try:
+                    payload = unpickler.load()
+                except EOFError:
+                    break
+                # older pickles hold a single list of dicts rather than a
+                # stream of individual dicts
+                if not isinstance(payload, list):
+                    payload = [payload]
+                for ticket_dict in payload:
+                    if isinstance(ticket_dict, str):
+                        # the original format pickled JSON strings
+                        ticket_dict = json.loads(ticket_dict)
+                    ticket = ticket_cls.__new__(ticket_cls)
+                    ticket.api = None
+                    ticket.__dict__.update(ticket_dict)
+                    cache[ticket.id] = ticket
         zenpy_client.tickets.cache.mapping['ticket'] = cache
 
     if getattr(config, 'pickle_tickets', None):
@@ -223,36 +282,69 @@ def handle_pickling(config, zenpy_client):
     return zenpy_client
 
 
-def get_client(config):
-    """Given a `config`, create a Zenpy API client."""
-    zenpy_args = dict([
-        (zenpy_key, getattr(config, config_key, None))
-        for zenpy_key, config_key in [
-            ('email', 'email'),
-            ('password', 'password'),
-            ('subdomain', 'subdomain')
-        ]
-    ])
+# Cache of Zenpy clients keyed on the config values used to build them,
+# since client creation can involve unpickling a large ticket cache.
+_CLIENT_CACHE = {}
+
+
+def get_client(config, session=None):
+    """
+    Given a `config`, create (or reuse) a Zenpy API client.
+
+    Args
+    ----
+        config (:obj:`configargparse.Namespace`): the config namespace
+        session (:obj:`requests.Session`, optional): an existing session to
+            make API calls through, e.g. the one `validate_connection`
+            already opened a connection with.
+    """
+    import zenpy
+
+    if session is None:
+        session = _get_session()
+
+    # keyed on session identity as well, so a cached client is never
+    # returned for a different session than it was built with
+    cache_key = (id(session),) + tuple(
+        getattr(config, key, None) for key in (
+            'subdomain', 'email', 'password',
+            'unpickle_tickets', 'pickle_tickets', 'pickle_path'
+        )
+    )
+    if cache_key in _CLIENT_CACHE:
+        return _CLIENT_CACHE[cache_key]
+
+    zenpy_args = {
+        'email': getattr(config, 'email', None),
+        'password': getattr(config, 'password', None),
+        'subdomain': getattr(config, 'subdomain', None),
+        'session': session,
+    }
 
     try:
-        zenpy_client = Zenpy(**zenpy_args)
+        zenpy_client = zenpy.Zenpy(**zenpy_args)
     except zenpy.lib.exception.ZenpyException as exc:
         if getattr(config, 'unpickle_tickets', None):
             zenpy_args['password'] = zenpy_args['password'] or 'dummy_pass'
             zenpy_args['subdomain'] = zenpy_args['subdomain'] \
                 or 'dummy_subdomain'
             zenpy_args['email'] = zenpy_args['email'] or 'dummy_email'
-            zenpy_client = Zenpy(**zenpy_args)
+            zenpy_client = zenpy.Zenpy(**zenpy_args)
         else:
             raise ZTVConfigException(str(exc))
 
-    return handle_pickling(config, zenpy_client)
+    zenpy_client = handle_pickling(config, zenpy_client)
+    _CLIENT_CACHE[cache_key] = zenpy_client
+    return zenpy_client
 
 
 def pickle_tickets(config, client):
     """Store API tickets for later deserialization."""
     ticket_generator = client.tickets()
     with open(config.pickle_path, 'wb') as dump_file:
-        tickets = [ticket.to_json() for ticket in ticket_generator]
-        # needs to be unpickable on PY2 and PY3
-        pickle.dump(tickets, dump_file, protocol=2)
+        # Stream one pickled dict per ticket so the whole collection never
+        # has to be held in memory at once.
+        pickler = pickle.Pickler(dump_file, protocol=pickle.HIGHEST_PROTOCOL)
+        for ticket in ticket_generator:
+            pickler.dump(ticket.to_dict())
+            pickler.clear_memo()